@@ -1,11 +1,74 @@
 """
 Loading animation utilities for OpenHands CLI.
 Provides animated loading screens during agent initialization.
+
+This deliberately does not use prompt_toolkit's ProgressBar/Application
+renderer: those target determinate iteration and run a full layout and
+renderer of their own, which is far heavier than the single diffed write
+per frame emitted here. The hand-rolled loop stays TTY-aware, lock-
+serialized and allocation-free in steady state.
 """
 
+import itertools
+import os
 import sys
 import threading
-import time
+
+# Animation frames are fully assembled at import time as byte templates with
+# a %b slot where the loading text goes. Each frame is emitted as a single
+# write so every escape sequence reaches the terminal intact instead of
+# letting a context switch land between partial writes.
+#
+# In-place updates only need carriage return plus erase-to-end-of-line
+# (\033[K), which every terminal supports. Cursor save/restore and screen
+# clearing are avoided entirely: some terminals answer those with a cursor
+# position report, which is how stray ^[[62;1R-style bytes end up in the
+# input stream.
+_SPINNER_GLYPHS = ('⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏')
+_CR, _ERASE_LINE = b'\r', b'\x1b[K'
+_COLOR_GOLD, _COLOR_RESET = b'\x1b[38;2;255;215;0m', b'\x1b[0m'
+_FRAME_TEMPLATES = tuple(
+    _CR + _COLOR_GOLD + b'[' + glyph.encode('utf-8') + b'] %b'
+    + _COLOR_RESET + _ERASE_LINE
+    for glyph in _SPINNER_GLYPHS
+)
+_SETUP = '\n\033[?25l'
+_TEARDOWN = '\r\033[K\033[?25h'
+_FRAME_INTERVAL = 0.1  # seconds between animation frames
+
+# Serializes stdout access between concurrent loading contexts so each escape
+# sequence reaches the terminal atomically. Held only around a write+flush
+# pair, never across a sleep, so contention stays on the animation cadence.
+_STDOUT_LOCK = threading.Lock()
+
+
+def _stdout_fd() -> int | None:
+    """Return stdout's file descriptor, or None if it has no real one.
+
+    Tests and some embedders replace sys.stdout with StringIO or a mock,
+    neither of which is backed by a descriptor we could os.write() to.
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    return fd if isinstance(fd, int) else None
+
+
+def _write(data: str) -> None:
+    """Write a complete escape sequence (or line) to stdout in one call.
+
+    Uses a single os.write() when stdout has a real descriptor so the
+    sequence can never be split across buffered writes; otherwise falls
+    back to the buffered stream.
+    """
+    with _STDOUT_LOCK:
+        fd = _stdout_fd()
+        if fd is not None:
+            os.write(fd, data.encode('utf-8'))
+        else:
+            sys.stdout.write(data)
+            sys.stdout.flush()
 
 
 def display_initialization_animation(text: str, is_loaded: threading.Event) -> None:
@@ -15,20 +78,36 @@ def display_initialization_animation(text: str, is_loaded: threading.Event) -> N
         text: The text to display alongside the animation
         is_loaded: Threading event that signals when loading is complete
     """
-    ANIMATION_FRAMES = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+    if not sys.stdout.isatty():
+        return
 
-    i = 0
-    while not is_loaded.is_set():
-        sys.stdout.write('\n')
-        sys.stdout.write(
-            f'\033[s\033[J\033[38;2;255;215;0m[{ANIMATION_FRAMES[i % len(ANIMATION_FRAMES)]}] {text}\033[0m\033[u\033[1A'
-        )
-        sys.stdout.flush()
-        time.sleep(0.1)
-        i += 1
+    # Substitute the text into every byte template once, so the loop is
+    # reduced to an index step and a single write with zero per-frame
+    # string or encoding work.
+    text_bytes = text.encode('utf-8')
+    frames: tuple = tuple(t % text_bytes for t in _FRAME_TEMPLATES)
+    fd = _stdout_fd()
+    if fd is None:
+        # The buffered fallback writes through a text stream
+        frames = tuple(f.decode('utf-8') for f in frames)
 
-    sys.stdout.write('\r' + ' ' * (len(text) + 10) + '\r')
-    sys.stdout.flush()
+    # cycle() keeps the rotation to a single C-level next() call and avoids
+    # an ever-growing frame counter on long-lived sessions.
+    for frame in itertools.cycle(frames):
+        if is_loaded.is_set():
+            break
+        with _STDOUT_LOCK:
+            if fd is not None:
+                # One unbuffered syscall per frame: no TextIOWrapper
+                # buffering, and the whole escape sequence lands atomically.
+                os.write(fd, frame)
+            else:
+                sys.stdout.write(frame)
+                sys.stdout.flush()
+        # wait() doubles as the frame delay and reacts to set() immediately,
+        # so shutdown is not delayed by up to a full frame interval.
+        if is_loaded.wait(timeout=_FRAME_INTERVAL):
+            break
 
 
 class LoadingContext:
@@ -43,9 +122,16 @@ class LoadingContext:
         self.text = text
         self.is_loaded = threading.Event()
         self.loading_thread: threading.Thread | None = None
+        self._is_tty = sys.stdout.isatty()
 
     def __enter__(self) -> 'LoadingContext':
         """Start the loading animation in a separate thread."""
+        if not self._is_tty:
+            # Cursor escapes are garbage in pipes and log files; just print
+            # the text once and skip the animation thread entirely.
+            _write(f'{self.text}\n')
+            return self
+        _write(_SETUP)
         self.loading_thread = threading.Thread(
             target=display_initialization_animation,
             args=(self.text, self.is_loaded),
@@ -56,8 +142,13 @@ class LoadingContext:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Stop the loading animation and clean up the thread."""
+        if not self._is_tty:
+            return
         self.is_loaded.set()
         if self.loading_thread:
             self.loading_thread.join(
                 timeout=1.0
             )  # Wait up to 1 second for thread to finish
+        # The thread has been joined, so this final wipe-and-show-cursor
+        # sequence cannot interleave with an in-flight frame.
+        _write(_TEARDOWN)
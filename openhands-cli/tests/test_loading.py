@@ -3,6 +3,8 @@
 Unit tests for the loading animation functionality.
 """
 
+import concurrent.futures
+import io
 import threading
 import time
 import unittest
@@ -17,6 +19,38 @@ from openhands_cli.listeners.loading_listener import (
 class TestLoadingAnimation(unittest.TestCase):
     """Test cases for loading animation functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared worker pool so individual tests don't pay thread
+        # creation/teardown for every run.
+        cls.pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown(wait=True)
+
+    def setUp(self):
+        # Every test patches stdout, so do it once here. The default mock
+        # behaves like a TTY (isatty() is truthy); tests that need a
+        # non-TTY stream re-patch locally.
+        self._stdout_patcher = patch('sys.stdout')
+        self.mock_stdout = self._stdout_patcher.start()
+        # Record writes with a plain list instead of MagicMock's per-call
+        # bookkeeping; the animation can write hundreds of times per test.
+        # An event flags the first write so tests can wait for the animation
+        # to be demonstrably running instead of sleeping a guessed interval.
+        self.write_calls: list[str] = []
+        self.first_write = threading.Event()
+
+        def record_write(chunk: str) -> None:
+            self.write_calls.append(chunk)
+            self.first_write.set()
+
+        self.mock_stdout.write = record_write
+
+    def tearDown(self):
+        self._stdout_patcher.stop()
+
     def test_loading_context_manager(self):
         """Test that LoadingContext works as a context manager."""
         with LoadingContext('Test loading...') as ctx:
@@ -24,16 +58,13 @@ class TestLoadingAnimation(unittest.TestCase):
             self.assertEqual(ctx.text, 'Test loading...')
             self.assertIsInstance(ctx.is_loaded, threading.Event)
             self.assertIsNotNone(ctx.loading_thread)
-            # Give the thread a moment to start
-            time.sleep(0.1)
             self.assertTrue(ctx.loading_thread.is_alive())
 
-        # After exiting context, thread should be stopped
-        time.sleep(0.1)
+        # __exit__ joins the thread, so it must already be stopped
+        ctx.loading_thread.join(timeout=1.0)
         self.assertFalse(ctx.loading_thread.is_alive())
 
-    @patch('sys.stdout')
-    def test_animation_writes_while_running_and_stops_after(self, mock_stdout):
+    def test_animation_writes_while_running_and_stops_after(self):
         """Ensure stdout is written while animation runs and stops after it ends."""
         is_loaded = threading.Event()
 
@@ -44,26 +75,70 @@ class TestLoadingAnimation(unittest.TestCase):
         )
         animation_thread.start()
 
-        # Let it run a bit and check calls
-        time.sleep(0.2)
-        calls_while_running = mock_stdout.write.call_count
-        self.assertGreater(calls_while_running, 0, 'Expected writes while spinner runs')
+        # Wait until at least one frame has actually been written
+        self.assertTrue(
+            self.first_write.wait(timeout=0.5), 'Expected writes while spinner runs'
+        )
 
-        # Stop animation
+        # Stop animation; the thread reacts to the event without a poll delay
         is_loaded.set()
-        time.sleep(0.2)
-
-        animation_thread.join(timeout=1.0)
-        calls_after_stop = mock_stdout.write.call_count
+        animation_thread.join(timeout=0.2)
+        self.assertFalse(animation_thread.is_alive())
+        calls_after_stop = len(self.write_calls)
 
         # Wait a moment to detect any stray writes after thread finished
-        time.sleep(0.2)
+        time.sleep(0.05)
         self.assertEqual(
             calls_after_stop,
-            mock_stdout.write.call_count,
+            len(self.write_calls),
             'No extra writes should occur after animation stops',
         )
 
+    def test_escape_sequences_in_loading_animation(self):
+        """Frames carry exactly the expected escape sequences, nothing exotic."""
+        is_loaded = threading.Event()
+
+        animation_thread = threading.Thread(
+            target=display_initialization_animation,
+            args=('Test output', is_loaded),
+            daemon=True,
+        )
+        animation_thread.start()
+        self.assertTrue(self.first_write.wait(timeout=0.5))
+        is_loaded.set()
+        animation_thread.join(timeout=0.2)
+
+        output = ''.join(self.write_calls)
+        # Single pass over the sentinels instead of one assertIn scan each
+        expected = ('\r', '\033[K', '\033[38;2;255;215;0m', '\033[0m')
+        missing = [seq for seq in expected if seq not in output]
+        self.assertFalse(missing, f'missing escape sequences: {missing}')
+        # The animation must never solicit a Device Status Report
+        self.assertNotIn('\033[6n', output)
+
+    def test_non_tty_prints_text_once_without_thread(self):
+        """Without a TTY the context prints one plain line and spawns no thread."""
+        captured = io.StringIO()
+        with patch('sys.stdout', captured):
+            with LoadingContext('Test loading...') as ctx:
+                self.assertIsNone(ctx.loading_thread)
+
+        self.assertEqual(captured.getvalue(), 'Test loading...\n')
+
+    def test_concurrent_loading_contexts(self):
+        """Concurrent contexts sharing stdout must not raise or deadlock."""
+
+        def run_context(label: str) -> str:
+            with LoadingContext(f'Loading {label}...'):
+                time.sleep(0.15)
+            return label
+
+        futures = [self.pool.submit(run_context, str(n)) for n in range(3)]
+        results = [f.result(timeout=2.0) for f in futures]
+
+        self.assertEqual(sorted(results), ['0', '1', '2'])
+        self.assertGreater(len(self.write_calls), 0)
+
 
 if __name__ == '__main__':
     unittest.main()